@@ -23,11 +23,12 @@ Tencent Cloud SDK for Python Sub-Package installer
 https://github.com/nobody-night/tencent-cloud-sdk-python
 '''
 
+import pathlib
 import setuptools
 
 def read_readme_content() -> str:
-    with open('README.md', encoding = 'utf-8') as readme_file_handle:
-        return readme_file_handle.read()
+    return pathlib.Path(__file__).with_name('README.md').read_text(
+        encoding = 'utf-8')
 
 setuptools.setup(
     name = 'tencent-cloud-sdk-common',
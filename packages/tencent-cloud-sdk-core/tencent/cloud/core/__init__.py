@@ -26,6 +26,7 @@ Raises:
     RuntimeError: Current Python runtime version is less than 3.6
 '''
 
+import os
 import sys
 
 # Check if the current Python runtime version is less than 3.6
@@ -37,3 +38,15 @@ if (sys.version_info.major == 3 and
     sys.version_info.minor < 6
 ):
     raise RuntimeError('runtime version is lower than 3.6')
+
+# Use uvloop as the event loop policy if requested by the environment
+# variable TENCENTCLOUD_UVLOOP and the uvloop package is installed.
+
+if os.environ.get('TENCENTCLOUD_UVLOOP') == '1':
+    try:
+        import asyncio
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
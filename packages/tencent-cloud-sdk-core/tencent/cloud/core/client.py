@@ -211,13 +211,15 @@ class BaseClient:
             # Internal request client has been closed
             return
 
-        if self._get_event_loop().is_closed():
+        event_loop: asyncio.AbstractEventLoop = self._get_event_loop()
+
+        if event_loop.is_closed():
             # The event loop instance running in the hyperthreaded context
             # of the underlying client should not be closed.
             raise RuntimeError('destroy the client before the event loop closes')
 
-        if not self._get_event_loop().is_running():
-            self._get_event_loop().run_until_complete(self.__request_client.close())
+        if not event_loop.is_running():
+            event_loop.run_until_complete(self.__request_client.close())
         else:
             # This happens when the caller does not explicitly close the client.
             #
@@ -238,7 +240,7 @@ class BaseClient:
                 await self.__request_client.close()
 
             setattr(self.__request_client.connector, '_closed', True)
-            self._get_event_loop().create_task(_internal_session_close())
+            event_loop.create_task(_internal_session_close())
 
     @property
     def error_manager(self) -> errors.ErrorManager:
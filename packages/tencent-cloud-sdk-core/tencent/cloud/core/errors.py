@@ -22,6 +22,8 @@
 Defines the exception type for the Tencent Cloud SDK.
 '''
 
+import enum
+
 class Error(Exception):
     '''
     Tencent Cloud SDK exception base class, any exceptions
@@ -68,7 +70,7 @@ class ResponseError(ClientError):
         status_code: int,
         error_message: str = None
     ):
-        if not status_code or not isinstance(status_code, int):
+        if not isinstance(status_code, int) or not status_code:
             raise ValueError('<status_code> value invalid')
 
         if error_message and not isinstance(error_message, str):
@@ -91,16 +93,16 @@ class ActionError(ClientError):
         error_message: str,
         request_id: str
     ):
-        if not action_id or not isinstance(action_id, str):
+        if not isinstance(action_id, str) or not action_id:
             raise ValueError('<action_id> value invalid')
 
-        if not error_id or not isinstance(error_id, str):
+        if not isinstance(error_id, str) or not error_id:
             raise ValueError('<error_id> value invalid')
 
-        if not error_message or not isinstance(error_message, str):
+        if not isinstance(error_message, str) or not error_message:
             raise ValueError('<error_message> value invalid')
 
-        if not request_id or not isinstance(request_id, str):
+        if not isinstance(request_id, str) or not request_id:
             raise ValueError('<request_id> value invalid')
 
         self.action_id: str = action_id
@@ -126,10 +128,14 @@ class ActionResultError(ClientError):
         but the response did not meet expectations.
     '''
 
-class ErrorHandlerResult:
+class ErrorHandlerResult(enum.IntEnum):
     '''
     Error handler result enumerator.
 
+    The members are also exposed as the module-level names
+        IGNORE, THROW, RETRY and BACKOFF. Error handlers may
+        return either the members or plain integers.
+
     Members:
         Ignore: Ignore the error and pass to the next error handler (if any).
         Throw: Handle and throw the exception instance corresponding to the error.
@@ -142,6 +148,14 @@ class ErrorHandlerResult:
     Retry: int = 2
     Backoff: int = 3
 
+# Error handler results, error handlers should prefer
+# these module-level names.
+
+IGNORE: int = ErrorHandlerResult.Ignore
+THROW: int = ErrorHandlerResult.Throw
+RETRY: int = ErrorHandlerResult.Retry
+BACKOFF: int = ErrorHandlerResult.Backoff
+
 class ErrorManager:
     '''
     Represents the type of one or more error handlers and configurations.
@@ -157,6 +171,7 @@ class ErrorManager:
         error_handlers: list = None
     ):
         self.__error_handlers: list = list()
+        self.__error_handlers_snapshot: tuple = tuple()
 
         if error_handlers:
             if not isinstance(error_handlers, list):
@@ -183,7 +198,7 @@ class ErrorManager:
         Maximum number of retries for errors, value must be greater than 0.
         '''
 
-        if not value or not isinstance(value, int):
+        if not isinstance(value, int) or value <= 0:
             raise ValueError('<max_number_of_retries> value invalid')
 
         self.__max_number_of_retries = value
@@ -212,9 +227,11 @@ class ErrorManager:
             this value must be greater than 0.
         '''
 
-        if not value or not isinstance(value, int):
+        if not isinstance(value, int) or value <= 0:
             raise ValueError('<max_backoff_interval> value invalid')
 
+        self.__max_backoff_interval = value
+
     @max_backoff_interval.deleter
     def max_backoff_interval(self):
         '''
@@ -238,7 +255,7 @@ class ErrorManager:
         Whether the error manager is enabled.
         '''
 
-        if value == None or not isinstance(value, bool):
+        if not isinstance(value, bool):
             raise ValueError('<enabled> value invalid')
         
         self.__enabled = value
@@ -275,19 +292,26 @@ class ErrorManager:
             raise ValueError('<error_instance> value invalid')
 
         if not self.__enabled:
-            return ErrorHandlerResult.Throw
+            return THROW
 
-        for error_handler in self.__error_handlers:
+        # Bind the result constant locally, it is compared once
+        # for every error handler on every handled error.
+        ignore_result: int = IGNORE
+
+        # Iterate over the snapshot, error handlers may add or
+        # remove error handlers while being called.
+        for error_handler in self.__error_handlers_snapshot:
             handler_result: int = error_handler(self, error_source, error_instance,
                 error_retry_count)
 
-            if handler_result == None or not isinstance(handler_result, int):
-                raise ValueError('<handler_result> value invalid')
+            if __debug__:
+                if handler_result is None or not isinstance(handler_result, int):
+                    raise ValueError('<handler_result> value invalid')
 
-            if handler_result != ErrorHandlerResult.Ignore:
+            if handler_result != ignore_result:
                 return handler_result
-        
-        return ErrorHandlerResult.Throw
+
+        return THROW
 
     def add_handler(self,
         error_handler: object
@@ -303,13 +327,14 @@ class ErrorManager:
             ExistedError: The given error handler callback function already exists.
         '''
 
-        if not error_handler and callable(error_handler):
+        if not error_handler or not callable(error_handler):
             raise ValueError('<error_handler> value invalid')
 
         if error_handler in self.__error_handlers:
             raise ExistedError('error handler already exists')
 
         self.__error_handlers.append(error_handler)
+        self.__error_handlers_snapshot = tuple(self.__error_handlers)
     
     def remove_handler(self,
         error_handler: object
@@ -326,15 +351,16 @@ class ErrorManager:
                 handler was not found.
         '''
     
-        if not error_handler and callable(error_handler):
+        if not error_handler or not callable(error_handler):
             raise ValueError('<error_handler> value invalid')
 
         try:
-            del self.__error_handlers[
-                self.__error_handlers.index(error_handler)]
+            self.__error_handlers.remove(error_handler)
         except ValueError:
             raise NotFoundError('no such error handler')
 
+        self.__error_handlers_snapshot = tuple(self.__error_handlers)
+
     def has_handler(self,
         error_handler: object
     ):
@@ -348,7 +374,7 @@ class ErrorManager:
             ValueError: Parameter values are not as expected.
         '''
 
-        if not error_handler and callable(error_handler):
+        if not error_handler or not callable(error_handler):
             raise ValueError('<error_handler> value invalid')
 
         return error_handler in self.__error_handlers
@@ -359,3 +385,4 @@ class ErrorManager:
         '''
 
         self.__error_handlers.clear()
+        self.__error_handlers_snapshot = tuple()
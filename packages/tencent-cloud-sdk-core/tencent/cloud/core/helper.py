@@ -22,20 +22,25 @@
 Implemented the Tencent Cloud SDK helper functions.
 '''
 
+import types
 import asyncio
 
+_cached_event_loop: asyncio.AbstractEventLoop = None
+
 def run_with_asyncio(
     coroutine: asyncio.Future
 ):
     '''
-    Create a new event loop and call the given coroutine. The caller will be
+    Call the given coroutine on the helper event loop. The caller will be
     blocked until the coroutine completes.
 
     In general, run_with_asyncio is used instead of asyncio.run to avoid
     compatibility issues. The caller should only call at the entry point.
 
-    The event loop created will be set as the global default event loop and
-    will not be closed until the process terminates.
+    The event loop is created on first use and reused by subsequent calls.
+    It will be set as the global default event loop and will not be closed
+    until the process terminates. If it has been closed by the caller, a
+    new one is created.
 
     Args:
         coroutine: Coroutine that need to be called on the event loop.
@@ -44,9 +49,15 @@ def run_with_asyncio(
         ValueError: The given coroutine is invalid.
     '''
 
-    if not asyncio.iscoroutine(coroutine):
+    if (coroutine.__class__ is not types.CoroutineType and
+        not asyncio.iscoroutine(coroutine)
+    ):
         raise ValueError('future is not coroutine')
 
-    event_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
-    asyncio.set_event_loop(event_loop)
-    event_loop.run_until_complete(coroutine)
+    global _cached_event_loop
+
+    if not _cached_event_loop or _cached_event_loop.is_closed():
+        _cached_event_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_cached_event_loop)
+
+    _cached_event_loop.run_until_complete(coroutine)
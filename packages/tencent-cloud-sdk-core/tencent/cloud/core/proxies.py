@@ -23,9 +23,13 @@ Implements a proxy server context type.
 '''
 
 import os
+import collections
 
 from tencent.cloud.core import errors
 
+# Internal record of a registered proxy server.
+_ProxyEntry = collections.namedtuple('_ProxyEntry', 'type endpoint auth')
+
 class ProxyType:
     '''
     Proxy server type enumerator
@@ -55,15 +59,73 @@ class Proxies:
         proxy_endpoint: str,
         proxy_auth: dict = None
     ):
-        self.proxy_name: str = None
-        self.proxy_type: str = None
-        self.proxy_endpoint: str = None
-        self.proxy_auth: dict = None
+        self._check_proxy_server(proxy_name, proxy_type, proxy_endpoint, proxy_auth)
+        self._initialize_proxies(proxy_name, proxy_type, proxy_endpoint, proxy_auth)
+
+    def _initialize_proxies(self,
+        proxy_name: str,
+        proxy_type: str,
+        proxy_endpoint: str,
+        proxy_auth: dict
+    ):
+        '''
+        Internal method: Initialize the proxy servers with the given
+            proxy server as the active one, without validation.
+        '''
+
+        self.proxy_name: str = proxy_name
+        self.proxy_type: str = proxy_type
+        self.proxy_endpoint: str = proxy_endpoint
+        self.proxy_auth: dict = proxy_auth
+
+        self.__proxies: dict = {
+            proxy_name: _ProxyEntry(proxy_type, proxy_endpoint, proxy_auth)
+        }
+
+    def _check_proxy_server(self,
+        proxy_name: str,
+        proxy_type: str,
+        proxy_endpoint: str,
+        proxy_auth: dict
+    ):
+        '''
+        Internal method: Validate the given proxy server parameters.
+        '''
+
+        if not isinstance(proxy_name, str) or not proxy_name:
+            raise ValueError('<proxy_name> value invalid')
+
+        if not isinstance(proxy_type, str) or not proxy_type:
+            raise ValueError('<proxy_type> value invalid')
+
+        if not isinstance(proxy_endpoint, str) or not proxy_endpoint:
+            raise ValueError('<proxy_endpoint> value invalid')
+
+        if proxy_auth:
+            if not isinstance(proxy_auth, dict):
+                raise ValueError('<proxy_auth> value invalid')
+            
+            if 'username' not in proxy_auth:
+                raise ValueError('<proxy_auth> value missing field: username')
+
+            if 'password' not in proxy_auth:
+                raise ValueError('<proxy_auth> value missing field: password')
+
+    def _add_proxy_server(self,
+        proxy_name: str,
+        proxy_type: str,
+        proxy_endpoint: str,
+        proxy_auth: dict
+    ):
+        '''
+        Internal method: Add a new proxy server without validation.
+        '''
 
-        self.__proxies: dict = dict()
+        if proxy_name in self.__proxies:
+            raise errors.ExistedError('a proxy server with the same name already exists')
 
-        self.add_proxy_server(proxy_name, proxy_type, proxy_endpoint, proxy_auth)
-        self.use_proxy_server(proxy_name)
+        self.__proxies[proxy_name] = _ProxyEntry(proxy_type,
+            proxy_endpoint, proxy_auth)
 
     def use_proxy_server(self,
         proxy_name: str
@@ -79,13 +141,13 @@ class Proxies:
         '''
 
         try:
-            self.proxy_type = self.__proxies[proxy_name]['type']
-            self.proxy_endpoint = self.__proxies[proxy_name]['endpoint']
-            self.proxy_auth = self.__proxies[proxy_name]['auth']
-            self.proxy_name = proxy_name
+            self.proxy_type, self.proxy_endpoint, self.proxy_auth = (
+                self.__proxies[proxy_name])
         except KeyError:
             raise errors.NotFoundError('no such proxy server: ' + proxy_name)
 
+        self.proxy_name = proxy_name
+
     def add_proxy_server(self,
         proxy_name: str,
         proxy_type: str,
@@ -107,33 +169,8 @@ class Proxies:
             ExistedError: A proxy server with the same name already exists.
         '''
 
-        if not proxy_name or not isinstance(proxy_name, str):
-            raise ValueError('<proxy_name> value invalid')
-
-        if not proxy_type or not isinstance(proxy_type, str):
-            raise ValueError('<proxy_type> value invalid')
-
-        if not proxy_endpoint or not isinstance(proxy_endpoint, str):
-            raise ValueError('<proxy_endpoint> value invalid')
-
-        if proxy_auth:
-            if not isinstance(proxy_auth, dict):
-                raise ValueError('<proxy_auth> value invalid')
-            
-            if 'username' not in proxy_auth:
-                raise ValueError('<proxy_auth> value missing field: username')
-
-            if 'password' not in proxy_auth:
-                raise ValueError('<proxy_auth> value missing field: password')
-        
-        if proxy_name in self.__proxies:
-            raise errors.ExistedError('a proxy server with the same name already exists')
-
-        self.__proxies[proxy_name] = {
-            'type': proxy_type,
-            'endpoint': proxy_endpoint,
-            'auth': proxy_auth
-        }
+        self._check_proxy_server(proxy_name, proxy_type, proxy_endpoint, proxy_auth)
+        self._add_proxy_server(proxy_name, proxy_type, proxy_endpoint, proxy_auth)
 
     def remove_proxy_server(self,
         proxy_name: str
@@ -149,7 +186,7 @@ class Proxies:
             NotFoundError: No given proxy server found.
         '''
 
-        if not proxy_name or not isinstance(proxy_name, str):
+        if not isinstance(proxy_name, str) or not proxy_name:
             raise ValueError('<proxy_name> value invalid')
         
         if proxy_name == self.proxy_name:
@@ -171,19 +208,33 @@ class EnvironmentalProxies(Proxies):
     '''
 
     def __init__(self):
-        if 'TENCENTCLOUD_PROXY_TYPE' not in os.environ:
+        proxy_type: str = os.environ.get('TENCENTCLOUD_PROXY_TYPE')
+
+        if proxy_type is None:
             raise EnvironmentError('missing environment variable <TENCENTCLOUD_PROXY_TYPE>')
-        
-        if 'TENCENTCLOUD_PROXY_ENDPOINT' not in os.environ:
+
+        proxy_endpoint: str = os.environ.get('TENCENTCLOUD_PROXY_ENDPOINT')
+
+        if proxy_endpoint is None:
             raise EnvironmentError('missing environment variable <TENCENTCLOUD_PROXY_ENDPOINT>')
 
-        super().__init__(
+        # Environment variable values are always strings, so only
+        # emptiness needs to be checked before skipping validation.
+
+        if not proxy_type:
+            raise ValueError('<TENCENTCLOUD_PROXY_TYPE> value invalid')
+
+        if not proxy_endpoint:
+            raise ValueError('<TENCENTCLOUD_PROXY_ENDPOINT> value invalid')
+
+        proxy_username: str = os.environ.get('TENCENTCLOUD_PROXY_USERNAME')
+
+        self._initialize_proxies(
             proxy_name = 'default',
-            proxy_type = os.environ['TENCENTCLOUD_PROXY_TYPE'],
-            proxy_endpoint = os.environ['TENCENTCLOUD_PROXY_ENDPOINT'],
+            proxy_type = proxy_type,
+            proxy_endpoint = proxy_endpoint,
             proxy_auth = {
-                'username': os.environ['TENCENTCLOUD_PROXY_USERNAME'],
-                'password': (os.environ['TENCENTCLOUD_PROXY_PASSWORD'] if
-                    'TENCENTCLOUD_PROXY_PASSWORD' in os.environ else None)
-            } if 'TENCENTCLOUD_PROXY_USERNAME' in os.environ else None
+                'username': proxy_username,
+                'password': os.environ.get('TENCENTCLOUD_PROXY_PASSWORD')
+            } if proxy_username is not None else None
         )
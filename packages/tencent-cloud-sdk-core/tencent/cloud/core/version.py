@@ -37,13 +37,15 @@ class VersionInfo:
     MINOR: int = 1
     REVISION: int = 5
 
+_version_text: str = '{MAJOR}.{MINOR}.{REVISION}'.format(
+    MAJOR = VersionInfo.MAJOR,
+    MINOR = VersionInfo.MINOR,
+    REVISION = VersionInfo.REVISION
+)
+
 def get_version_text() -> str:
     '''
     Get the core version number string of the Tencent Cloud SDK.
     '''
 
-    return '{MAJOR}.{MINOR}.{REVISION}'.format(
-        MAJOR = VersionInfo.MAJOR,
-        MINOR = VersionInfo.MINOR,
-        REVISION = VersionInfo.REVISION
-    )
+    return _version_text
@@ -25,6 +25,8 @@ Implementing waitable abstract types.
 import inspect
 import asyncio
 
+from tencent.cloud.common import async_timeout
+
 class WaitableStatus:
     '''
     An enumerator containing waitable operation states.
@@ -46,22 +48,24 @@ class Waitable:
         ValueError: Parameter value or type is not as expected.
     '''
 
+    __slots__ = ('_event_loop', '_wait_status', '_wait_result')
+
     def __init__(self,
         event_loop: asyncio.AbstractEventLoop
     ):
         if not event_loop or not isinstance(event_loop, asyncio.AbstractEventLoop):
             raise ValueError('<event_loop> value invalid')
 
-        self.__event_loop: asyncio.AbstractEventLoop = event_loop
-        self.__wait_status: int = WaitableStatus.Created
-        self.__wait_result: object = None
+        self._event_loop: asyncio.AbstractEventLoop = event_loop
+        self._wait_status: int = WaitableStatus.Created
+        self._wait_result: object = None
 
     def _get_event_loop(self) -> asyncio.AbstractEventLoop:
         '''
         Internal method: Get the event loop instance.
         '''
 
-        return self.__event_loop
+        return self._event_loop
 
     def _set_status(self,
         wait_status: int
@@ -73,7 +77,7 @@ class Waitable:
         if wait_status == None or not isinstance(wait_status, int):
             raise ValueError('<wait_status> value invalid')
 
-        self.__wait_status = wait_status
+        self._wait_status = wait_status
 
     @property
     def status(self) -> int:
@@ -81,7 +85,7 @@ class Waitable:
         Indicates waitable operation status.
         '''
 
-        return self.__wait_status
+        return self._wait_status
     
     @property
     def result(self) -> object:
@@ -89,7 +93,7 @@ class Waitable:
         Indicates the result of the operation.
         '''
 
-        return self.__wait_result
+        return self._wait_result
 
     def set_result(self,
         wait_result: object
@@ -101,7 +105,7 @@ class Waitable:
             wait_result: Operation result instance.
         '''
 
-        self.__wait_result = wait_result
+        self._wait_result = wait_result
 
     async def wait_for_done_async(self,
         max_wait_seconds: float = 15
@@ -145,7 +149,7 @@ class Waitable:
             TimeoutError: Exceeded max waiting time limit.
         '''
 
-        return self.__event_loop.run_until_complete(self.wait_for_done_async(
+        return self._event_loop.run_until_complete(self.wait_for_done_async(
             max_wait_seconds))
 
     def has_done(self) -> bool:
@@ -157,7 +161,7 @@ class Waitable:
                 otherwise returns False.
         '''
 
-        return self.__wait_status == WaitableStatus.Completed
+        return self._wait_status == WaitableStatus.Completed
 
 class OperationWaitable(Waitable):
     '''
@@ -173,7 +177,9 @@ class OperationWaitable(Waitable):
     Raises:
         ValueError: Parameter value or type is not as expected.
     '''
-    
+
+    __slots__ = ('_wait_handler',)
+
     def __init__(self,
         event_loop: asyncio.AbstractEventLoop,
         wait_handler: object
@@ -184,7 +190,7 @@ class OperationWaitable(Waitable):
         if not inspect.iscoroutinefunction(wait_handler):
             raise ValueError('<wait_handler> not async function')
 
-        self.__wait_handler: object = wait_handler
+        self._wait_handler: object = wait_handler
         super().__init__(event_loop)
 
     async def wait_for_done_async(self,
@@ -211,19 +217,25 @@ class OperationWaitable(Waitable):
             if not isinstance(max_wait_seconds, float):
                 raise ValueError('<max_wait_seconds> value invalid')
 
-        self._set_status(WaitableStatus.Waiting)
+        if max_wait_seconds == 0:
+            # Like asyncio.wait_for, a zero timeout expires before
+            # the wait handler gets a chance to run.
+            raise TimeoutError('exceeded max waiting time limit')
+
+        self._wait_status = WaitableStatus.Waiting
 
         try:
-            self.set_result(
-                await asyncio.wait_for(self.__wait_handler(),
-                    max_wait_seconds, loop = self._get_event_loop())
-            )
+            if max_wait_seconds is None:
+                self.set_result(await self._wait_handler())
+            else:
+                async with async_timeout.timeout(max_wait_seconds):
+                    self.set_result(await self._wait_handler())
         except asyncio.TimeoutError:
-            self._set_status(WaitableStatus.Created)
+            self._wait_status = WaitableStatus.Created
             raise TimeoutError('exceeded max waiting time limit')
-        except:
-            self._set_status(WaitableStatus.Created)
+        except BaseException:
+            self._wait_status = WaitableStatus.Created
             raise
         
-        self._set_status(WaitableStatus.Completed)
+        self._wait_status = WaitableStatus.Completed
         return self.result
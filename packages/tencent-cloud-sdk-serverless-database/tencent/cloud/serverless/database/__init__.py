@@ -44,7 +44,11 @@ def fetch_client() -> Client:
 
     global __thread_local_attributes
 
-    if not hasattr(__thread_local_attributes, 'builtin_client'):
-        __thread_local_attributes.builtin_client = Client()
+    builtin_client: Client = getattr(__thread_local_attributes,
+        'builtin_client', None)
 
-    return __thread_local_attributes.builtin_client
+    if builtin_client is None:
+        builtin_client = Client()
+        __thread_local_attributes.builtin_client = builtin_client
+
+    return builtin_client
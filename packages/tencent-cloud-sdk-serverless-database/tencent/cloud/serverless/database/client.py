@@ -25,19 +25,62 @@ Object-oriented client types that implement Tencent Cloud's
     in an object-oriented programming manner.
 '''
 
+import sys
+import asyncio
+import operator
+
 from tencent.cloud.core import client
 
 from tencent.cloud.serverless.database import errors
 from tencent.cloud.serverless.database import helper
 
+def _require_str(
+    parameter_name: str,
+    parameter_value: str
+):
+    '''
+    Internal function: Ensure the given parameter is a non-empty string.
+
+    Raises:
+        ValueError: The parameter value is not as expected.
+    '''
+
+    if not isinstance(parameter_value, str) or not parameter_value:
+        raise ValueError('<' + parameter_name + '> value invalid')
+
+def _require_bool(
+    parameter_name: str,
+    parameter_value: bool
+):
+    '''
+    Internal function: Ensure the given parameter is a boolean.
+
+    Raises:
+        ValueError: The parameter value is not as expected.
+    '''
+
+    if not isinstance(parameter_value, bool):
+        raise ValueError('<' + parameter_name + '> value invalid')
+
+# Field extractors for the DescribeServerlessDBInstances results,
+# each fetches all the required fields of a record in one call.
+
+_instance_fields = operator.itemgetter('DBInstanceId', 'DBInstanceName',
+    'DBInstanceStatus', 'Region', 'Zone', 'ProjectId', 'VpcId', 'SubnetId',
+    'DBVersion', 'DBCharset', 'DBDatabaseList', 'CreateTime',
+    'DBInstanceNetInfo', 'DBAccountSet')
+
+_network_fields = operator.itemgetter('NetType', 'Status', 'Ip', 'Port')
+_user_fields = operator.itemgetter('DBUser', 'DBPassword')
+
 class DatabaseCharset:
     '''
     A character set type enumerator supported by
         serverless databases.
     '''
 
-    UTF8: str = 'UTF8'
-    LATIN1: str = 'LATIN1'
+    UTF8: str = sys.intern('UTF8')
+    LATIN1: str = sys.intern('LATIN1')
 
 class Client(client.UniversalClient):
     '''
@@ -51,7 +94,10 @@ class Client(client.UniversalClient):
     Raises:
         ValueError: The parameters did not meet expectations.
     '''
-    
+
+    # Cloud API version of the serverless database product.
+    _ACTION_VERSION: str = '2017-03-12'
+
     def __init__(self,
         access_credentials = None,
         access_proiexs = None
@@ -85,14 +131,11 @@ class Client(client.UniversalClient):
             ValueError: The parameters did not meet expectations.
         '''
 
-        if not region_id or not isinstance(region_id, str):
-            raise ValueError('<region_id> value invalid')
+        _require_str('region_id', region_id)
 
-        if not zone_id or not isinstance(zone_id, str):
-            raise ValueError('<zone_id> value invalid')
+        _require_str('zone_id', zone_id)
 
-        if not instance_name or not isinstance(instance_name, str):
-            raise ValueError('<instance_name> value invalid')
+        _require_str('instance_name', instance_name)
         
         if instance_configure:
             if not isinstance(instance_configure, dict):
@@ -137,7 +180,7 @@ class Client(client.UniversalClient):
             region_id = region_id,
             action_id = 'CreateServerlessDBInstance',
             action_parameters = action_parameters,
-            action_version = '2017-03-12'
+            action_version = self._ACTION_VERSION
         )
 
         try:
@@ -192,11 +235,9 @@ class Client(client.UniversalClient):
             ValueError: The parameters did not meet expectations.
         '''
 
-        if not region_id or not isinstance(region_id, str):
-            raise ValueError('<region_id> value invalid')
+        _require_str('region_id', region_id)
 
-        if not instance_id or not isinstance(instance_id, str):
-            raise ValueError('<instance_id> value invalid')
+        _require_str('instance_id', instance_id)
         
         await self.action_async(
             region_id = region_id,
@@ -204,7 +245,7 @@ class Client(client.UniversalClient):
             action_parameters = {
                 'DBInstanceId': instance_id
             },
-            action_version = '2017-03-12'
+            action_version = self._ACTION_VERSION
         )
 
     def delete_instance(self,
@@ -230,7 +271,8 @@ class Client(client.UniversalClient):
         )
 
     async def list_instances_async(self,
-        region_id: str
+        region_id: str,
+        page_size: int = 100
     ):
         '''
         List information about the serverless database
@@ -238,6 +280,7 @@ class Client(client.UniversalClient):
         
         Args:
             region_id: Data center unique identifier.
+            page_size: Number of instances requested per Cloud API call.
         
         Yields:
             Generate dictionary instances that contain
@@ -247,74 +290,106 @@ class Client(client.UniversalClient):
             ValueError: The parameters did not meet expectations.
         '''
 
-        if not region_id or not isinstance(region_id, str):
-            raise ValueError('<region_id> value invalid')
-        
+        _require_str('region_id', region_id)
+
+        if (isinstance(page_size, bool) or
+            not isinstance(page_size, int) or page_size < 1
+        ):
+            raise ValueError('<page_size> value invalid')
+
         action_parameters: dict = {
-            'Limit': 20,
+            'Limit': page_size,
             'Offset': 0
         }
 
-        while True:
-            action_result: dict = await self.action_async(
-                region_id = region_id,
-                action_id = 'DescribeServerlessDBInstances',
-                action_parameters = action_parameters,
-                action_version = '2017-03-12'
-            )
+        # The next page is requested while the current page is being
+        # consumed, so its round trip overlaps with the caller's work.
+        page_task: asyncio.Future = asyncio.ensure_future(self.action_async(
+            region_id = region_id,
+            action_id = 'DescribeServerlessDBInstances',
+            action_parameters = dict(action_parameters),
+            action_version = self._ACTION_VERSION
+        ))
 
-            if not action_result['DBInstanceSet']:
-                break
-            
-            if len(action_result['DBInstanceSet']) == 0:
-                break
-            
-            try:
-                for info in action_result['DBInstanceSet']:
-                    yield {
-                        'id': info['DBInstanceId'],
-                        'name': info['DBInstanceName'],
-                        'status': info['DBInstanceStatus'],
-                        'region_id': info['Region'],
-                        'zone_id': info['Zone'],
-                        'project_id': info['ProjectId'],
-                        'vpc': {
-                            'id': info['VpcId'],
-                            'subnet_id': info['SubnetId']
-                        },
-                        'database': {
-                            'version': info['DBVersion'],
-                            'charset': info['DBCharset'],
-                            'names': [
-                                name for name in info['DBDatabaseList']
-                            ] if info['DBDatabaseList'] else list()
-                        },
-                        'create_time': info['CreateTime'],
-                        'networks': [
-                            {
-                                'type': network_info['NetType'],
-                                'status': network_info['Status'],
-                                'address': {
-                                    'ip': network_info['Ip'],
-                                    'port': network_info['Port'],
-                                }
-                            } for network_info in info['DBInstanceNetInfo']
-                        ] if info['DBInstanceNetInfo'] else list(),
-                        'users': [
-                            {
-                                'name': user_info['DBUser'],
-                                'password': user_info['DBPassword']
-                            } for user_info in info['DBAccountSet']
-                        ] if info['DBAccountSet'] else list()
-                    }
-            except KeyError as error:
-                raise errors.errors.ActionResultError('missing field: ' + str(error))
-            
-            if len(action_result['DBInstanceSet']) < action_parameters['Limit']:
-                break
+        try:
+            while True:
+                action_result: dict = await page_task
+                page_task = None
+
+                instance_set: list = action_result['DBInstanceSet']
+
+                if not instance_set:
+                    break
+
+                # A short page is the last one, otherwise move the
+                # offset past this page and fetch the next one.
+                if len(instance_set) >= action_parameters['Limit']:
+                    action_parameters['Offset'] += len(instance_set)
+
+                    page_task = asyncio.ensure_future(self.action_async(
+                        region_id = region_id,
+                        action_id = 'DescribeServerlessDBInstances',
+                        action_parameters = dict(action_parameters),
+                        action_version = self._ACTION_VERSION
+                    ))
+
+                try:
+                    for info in instance_set:
+                        (instance_id, instance_name, instance_status, instance_region_id,
+                            instance_zone_id, project_id, vpc_id, subnet_id, database_version,
+                            database_charset, database_names, create_time, networks_info,
+                            users_info) = _instance_fields(info)
+
+                        yield {
+                            'id': instance_id,
+                            'name': instance_name,
+                            'status': instance_status,
+                            'region_id': instance_region_id,
+                            'zone_id': instance_zone_id,
+                            'project_id': project_id,
+                            'vpc': {
+                                'id': vpc_id,
+                                'subnet_id': subnet_id
+                            },
+                            'database': {
+                                'version': database_version,
+                                'charset': database_charset,
+                                'names': list(database_names) if database_names else []
+                            },
+                            'create_time': create_time,
+                            'networks': [
+                                {
+                                    'type': network_type,
+                                    'status': network_status,
+                                    'address': {
+                                        'ip': network_ip,
+                                        'port': network_port,
+                                    }
+                                } for network_type, network_status, network_ip, network_port
+                                    in map(_network_fields, networks_info)
+                            ] if networks_info else [],
+                            'users': [
+                                {
+                                    'name': user_name,
+                                    'password': user_password
+                                } for user_name, user_password in map(_user_fields, users_info)
+                            ] if users_info else []
+                        }
+                except KeyError as error:
+                    raise errors.errors.ActionResultError('missing field: ' + str(error))
+
+                if not page_task:
+                    break
+        finally:
+            if page_task:
+                # Cancel the prefetch and wait for it to exit, which also
+                # retrieves its exception if it has already failed.
+                page_task.cancel()
+                await asyncio.gather(page_task, return_exceptions = True)
 
     def list_instances(self,
-        region_id: str
+        region_id: str,
+        page_size: int = 100
     ):
         '''
         List information about the serverless database
@@ -322,6 +397,7 @@ class Client(client.UniversalClient):
         
         Args:
             region_id: Data center unique identifier.
+            page_size: Number of instances requested per Cloud API call.
         
         Yields:
             Generate dictionary instances that contain
@@ -331,16 +407,19 @@ class Client(client.UniversalClient):
             ValueError: The parameters did not meet expectations.
         '''
 
-        async_generator: object = self.list_instances_async(region_id)
+        async_generator: object = self.list_instances_async(region_id,
+            page_size)
 
+        # Drive the asynchronous generator one page at a time rather
+        # than one instance at a time.
         while True:
-            instance_info: dict = self._get_event_loop().run_until_complete(
-                helper.generator_proxy_async(async_generator))
-            
-            if not instance_info:
-                break
+            instance_infos: list = self._get_event_loop().run_until_complete(
+                helper.generator_collect_async(async_generator, page_size))
 
-            yield instance_info
+            yield from instance_infos
+
+            if len(instance_infos) < page_size:
+                break
 
     async def set_instance_extranet_async(self,
         region_id: str,
@@ -360,14 +439,11 @@ class Client(client.UniversalClient):
             ValueError: The parameters did not meet expectations.
         '''
 
-        if not region_id or not isinstance(region_id, str):
-            raise ValueError('<region_id> value invalid')
+        _require_str('region_id', region_id)
 
-        if not instance_id or not isinstance(instance_id, str):
-            raise ValueError('<instance_id> value invalid')
+        _require_str('instance_id', instance_id)
         
-        if instance_extranet == None or not isinstance(instance_extranet, bool):
-            raise ValueError('<instance_extranet> value invalid')
+        _require_bool('instance_extranet', instance_extranet)
 
         await self.action_async(
             region_id = region_id,
@@ -376,7 +452,7 @@ class Client(client.UniversalClient):
             action_parameters = {
                 'DBInstanceId': instance_id
             },
-            action_version = '2017-03-12'
+            action_version = self._ACTION_VERSION
         )
 
     def set_instance_extranet(self,
@@ -402,3 +478,63 @@ class Client(client.UniversalClient):
                 region_id, instance_id, instance_extranet
             )
         )
+
+    def batch(self,
+        *coroutines
+    ) -> list:
+        '''
+        Run multiple coroutines of this client concurrently on the event
+            loop of the client in a single event loop turn.
+
+        The synchronous methods are fine for one-off calls, scripts that
+            make several calls should prefer to pass the coroutines of the
+            corresponding asynchronous methods to this method.
+
+        Args:
+            coroutines: Coroutine instances to be run.
+        
+        If any coroutine raises an exception, the coroutines that are
+            still running are cancelled and awaited, and the exception
+            of the first failed coroutine is raised.
+
+        Returns:
+            Returns a list of the results of the coroutines,
+                in the order in which they were given.
+        
+        Raises:
+            ValueError: The parameters did not meet expectations.
+        '''
+
+        if not coroutines:
+            raise ValueError('<coroutines> value invalid')
+
+        for coroutine in coroutines:
+            if not asyncio.iscoroutine(coroutine):
+                # The given coroutines will never run, close them so
+                # that they are not reported as never awaited.
+                for given_coroutine in coroutines:
+                    if asyncio.iscoroutine(given_coroutine):
+                        given_coroutine.close()
+
+                raise ValueError('<coroutines> value invalid')
+
+        async def _gather_coroutines() -> list:
+            # Gather inside the event loop of the client, so that the
+            # tasks and the gathering future are bound to that event loop.
+            tasks: list = [asyncio.ensure_future(coroutine)
+                for coroutine in coroutines]
+
+            try:
+                return await asyncio.gather(*tasks)
+            except BaseException:
+                # Cancel the remaining tasks and wait for them to exit,
+                # so that none of them is left running unattended.
+                for task in tasks:
+                    task.cancel()
+
+                await asyncio.gather(*tasks, return_exceptions = True)
+                raise
+
+        return self._get_event_loop().run_until_complete(
+            _gather_coroutines()
+        )
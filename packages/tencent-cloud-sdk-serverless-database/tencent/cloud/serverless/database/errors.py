@@ -22,3 +22,5 @@
 Define the exception types that apply to Tencent Cloud's
     serverless database products.
 '''
+
+from tencent.cloud.core import errors
@@ -44,3 +44,33 @@ async def generator_proxy_async(
         return value
     
     return None
+
+async def generator_collect_async(
+    async_generator: object,
+    max_count: int
+) -> list:
+    '''
+    Asynchronous generator collector.
+
+    Args:
+        async_generator: Asynchronous generator instance.
+        max_count: Maximum number of values to collect.
+    
+    Returns:
+        Returns a list of at most max_count values generated by the
+            asynchronous generator. If there is no new value, an empty
+            list is returned.
+    
+    Raises:
+        TypeError: Parameter values are not as expected.
+    '''
+
+    values: list = []
+
+    async for value in async_generator:
+        values.append(value)
+
+        if len(values) >= max_count:
+            break
+
+    return values
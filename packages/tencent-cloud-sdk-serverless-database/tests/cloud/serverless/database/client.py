@@ -18,10 +18,45 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import sys
 import json
+import types
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from tencent.cloud.serverless import database
 
+# Encoder instances are reused for every value
+# when orjson is not available.
+json_encoder: json.JSONEncoder = json.JSONEncoder(indent = 2, default = str)
+compact_json_encoder: json.JSONEncoder = json.JSONEncoder(default = str)
+
+# The database instance configuration is built once, the client
+# requires a dictionary instance so a shallow copy is passed.
+database_instance_configure: types.MappingProxyType = types.MappingProxyType({
+    'database': {
+        'version': '10.4',
+        'charset': database.DatabaseCharset.UTF8
+    },
+    'vpc': {
+        'id': 'vpc-f7qfb64q',
+        'subnet_id': 'subnet-aieh8myj'
+    }
+})
+
+def encode_json(value: dict, indent: bool = True) -> bytes:
+    if orjson:
+        return orjson.dumps(value, default = str,
+            option = orjson.OPT_INDENT_2 if indent else 0)
+
+    if indent:
+        return json_encoder.encode(value).encode('utf-8')
+
+    return compact_json_encoder.encode(value).encode('utf-8')
+
 def main():
     client = database.fetch_client()
 
@@ -29,33 +64,51 @@ def main():
         region_id = 'ap-shanghai',
         zone_id = 'ap-shanghai-2',
         instance_name = 'unit-test',
-        instance_configure = {
-            'database': {
-                'version': '10.4',
-                'charset': database.DatabaseCharset.UTF8
-            },
-            'vpc': {
-                'id': 'vpc-f7qfb64q',
-                'subnet_id': 'subnet-aieh8myj'
-            }
-        }
+        instance_configure = dict(database_instance_configure)
     )
 
-    print('database instance id: ' + str(instance_info['id']))
+    print('database instance id:', instance_info['id'])
 
-    for info in client.list_instances('ap-shanghai'):
-        print(json.dumps(info, indent = 2), end = '\n\n')
+    async def print_instances():
+        # Pretty-print only for an interactive terminal,
+        # piped output is encoded compactly.
+        indent: bool = sys.stdout.isatty()
 
-    client.set_instance_extranet(
-        region_id = 'ap-shanghai',
-        instance_id = instance_info['id'],
-        instance_extranet = True
-    )
+        output_parts: list = list()
+        append = output_parts.append
 
-    client.delete_instance(
-        region_id = 'ap-shanghai',
-        instance_id = instance_info['id']
-    )
+        async for info in client.list_instances_async('ap-shanghai'):
+            append(encode_json(info, indent))
+            append(b'\n\n')
+
+        # Write the encoded instances to stdout at once through a
+        # binary writer with a larger buffer.
+        sys.stdout.flush()
+
+        with open(sys.stdout.fileno(), 'wb', buffering = 131072,
+            closefd = False
+        ) as output:
+            output.writelines(output_parts)
+
+    async def configure_and_delete_instance():
+        await client.set_instance_extranet_async(
+            region_id = 'ap-shanghai',
+            instance_id = instance_info['id'],
+            instance_extranet = True
+        )
+
+        await client.delete_instance_async(
+            region_id = 'ap-shanghai',
+            instance_id = instance_info['id']
+        )
+
+    # The listing shows the instance just created, so it completes
+    # before the instance is reconfigured and deleted. The extranet
+    # setting and the deletion act on the same instance, so they
+    # run one after the other.
+
+    client.batch(print_instances())
+    client.batch(configure_and_delete_instance())
 
 if __name__ == '__main__':
     main()
@@ -23,41 +23,9 @@ Tencent Cloud SDK for Python Sub-Package installer
 https://github.com/nobody-night/tencent-cloud-sdk-python
 '''
 
-import setuptools
+# The package metadata is declared statically in pyproject.toml,
+# this script is only kept for legacy setuptools invocations.
 
-def read_readme_content() -> str:
-    with open('README.md', encoding = 'utf-8') as readme_file_handle:
-        return readme_file_handle.read()
+import setuptools
 
-setuptools.setup(
-    name = 'tencent-cloud-sdk-serverless-functions',
-    version = '0.2.5',
-    packages = [
-        'tencent.cloud.serverless.functions'
-    ],
-    keywords = 'tencent-cloud sdk-python',
-    license = 'MIT License',
-    author = 'MIEK',
-    author_email = 'king@xiaoyy.org',
-    description = (
-        'Tencent Cloud SDK for Python components. '
-        'This package is the core component of the '
-        'Tencent Cloud SDK. Most Tencent Cloud SDK '
-        'components depend on this package.'
-    ),
-    long_description = read_readme_content(),
-    long_description_content_type = 'text/markdown',
-    url = 'https://github.com/nobody-night/tencent-cloud-sdk-python',
-    python_requires = '>=3.6',
-    zip_safe = False,
-    classifiers = [
-        'Programming Language :: Python :: 3.6',
-        'License :: OSI Approved :: MIT License',
-        'Operating System :: OS Independent',
-        'Development Status :: 5 - Production/Stable'
-        # 'Development Status :: 4 - Beta'
-    ],
-    install_requires = [
-        'tencent-cloud-sdk-core>=0.2.6'
-    ]
-)
+setuptools.setup()
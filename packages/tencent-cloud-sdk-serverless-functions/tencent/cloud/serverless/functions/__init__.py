@@ -30,9 +30,12 @@ Example:
 import sys
 import time
 import json
+import heapq
 import base64
 import asyncio
 import inspect
+import functools
+import itertools
 import threading
 
 from tencent.cloud.core import proxies
@@ -55,6 +58,128 @@ from tencent.cloud.serverless.functions.client import FunctionResultType
 
 from tencent.cloud.serverless.functions.integrate import IntegrateDispatch
 
+# JSON encoder of the integrated invoke protocol payloads,
+# compact separators keep the payloads small.
+_routine_payload_encoder: json.JSONEncoder = json.JSONEncoder(separators = (',', ':'))
+
+# Routine parameter value types whose encoded payloads may be cached,
+# the value type is part of the cache key since True == 1 == 1.0.
+_CACHEABLE_PARAMETER_TYPES: frozenset = frozenset((str, int, float, bool, type(None)))
+
+# Maximum length of a string routine parameter value whose encoded
+# payload may be cached, longer strings are not kept alive by the cache.
+_MAX_CACHEABLE_STRING_LENGTH: int = 64
+
+def _encode_routine_payload(
+    routine_name: str,
+    routine_parameter: dict
+) -> str:
+    '''
+    Internal function: Encode the integrated invoke protocol
+        payload for the given routine and routine parameters.
+    '''
+
+    return base64.b64encode(_routine_payload_encoder.encode(
+        {
+            'routine_name': routine_name,
+            'routine_parameter': routine_parameter
+        }
+    ).encode('ascii')).decode('ascii')
+
+@functools.lru_cache(maxsize = 1024)
+def _encode_cached_routine_payload(
+    routine_name: str,
+    parameter_key: tuple
+) -> str:
+    '''
+    Internal function: Encode and cache the integrated invoke protocol
+        payload for the given routine and routine parameter key.
+    '''
+
+    return _encode_routine_payload(routine_name, None if parameter_key is None
+        else { name: value for name, _, value in parameter_key })
+
+def _get_routine_payload(
+    routine_name: str,
+    routine_parameter: dict
+) -> str:
+    '''
+    Internal function: Get the integrated invoke protocol payload for
+        the given routine and routine parameters, the payloads of routine
+        parameters containing only scalar values and short strings are cached.
+    '''
+
+    if routine_parameter is None:
+        return _encode_cached_routine_payload(routine_name, None)
+
+    for value in routine_parameter.values():
+        if value.__class__ not in _CACHEABLE_PARAMETER_TYPES or (
+            value.__class__ is str and len(value) > _MAX_CACHEABLE_STRING_LENGTH
+        ):
+            return _encode_routine_payload(routine_name, routine_parameter)
+
+    return _encode_cached_routine_payload(routine_name, tuple(
+        (name, value.__class__, value) for name, value in routine_parameter.items()))
+
+# Whether tasks can be started eagerly (Python 3.12 and above),
+# an eagerly started task runs its first step in the caller.
+_EAGER_TASK_START: bool = sys.version_info >= (3, 12)
+
+# Minimum and maximum delay (in seconds) between two polls
+# of a Cloud Function result.
+_MIN_RESULT_POLL_DELAY: float = 0.05
+_MAX_RESULT_POLL_DELAY: float = 1.0
+
+async def _wait_function_result_async(
+    function_client: client.AbstractClient,
+    region_id: str,
+    namespace_name: str,
+    function_name: str,
+    function_version: str,
+    function_request_id: str
+) -> object:
+    '''
+    Internal function: Wait for the result of an asynchronous invoke of
+        a Cloud Function. The result is polled until it is available,
+        the polling delay grows exponentially up to the maximum
+        polling delay.
+
+    Returns:
+        Returns the automatically inferred Cloud Function return value.
+
+    Raises:
+        InvokeError: Invoke Cloud Function failed.
+    '''
+
+    # The first retry only yields to the event loop, the
+    # following retries back off exponentially.
+    poll_delay: float = 0
+
+    while True:
+        try:
+            function_result: dict = await function_client.get_function_result_by_request_id_async(
+                region_id = region_id,
+                namespace_name = namespace_name,
+                function_name = function_name,
+                function_request_id = function_request_id,
+                function_version = function_version
+            )
+
+            break
+        except errors.errors.NotFoundError:
+            await asyncio.sleep(poll_delay)
+
+            poll_delay = (min(poll_delay * 2, _MAX_RESULT_POLL_DELAY)
+                if poll_delay else _MIN_RESULT_POLL_DELAY)
+
+    if not function_result['is_successful']:
+        raise errors.InvokeError(
+            error_message = function_result['return_result'],
+            request_id = function_request_id
+        )
+
+    return helper.inferred_return_result(function_result['return_result'])
+
 class FunctionResultFuture(asyncio.Future):
     '''
     A Future type that represents the result of a
@@ -63,6 +188,13 @@ class FunctionResultFuture(asyncio.Future):
     Note that this type should not be instantiated
         directly unless necessary.
     '''
+
+    __slots__ = (
+        '__function_client',
+        '__function_metadata',
+        '__function_request_id',
+        '__result_future'
+    )
     
     def __init__(self,
         function_client: client.AbstractClient,
@@ -81,55 +213,64 @@ class FunctionResultFuture(asyncio.Future):
         self.__function_client: client.AbstractClient = function_client
         self.__function_metadata: dict = function_metadata
         self.__function_request_id: str = function_request_id
+        self.__result_future: asyncio.Future = None
         
         super().__init__()
 
     def _complete_callback(self,
-        result_future: asyncio.Future = None
+        result_future: asyncio.Future
     ):
         '''
         Obtaining Cloud Function results is complete.
-        
-        If the acquisition has not started, a coroutine
-            acquisition task is created.
-        '''
-
-        if not result_future:
-            result_future: asyncio.Future = asyncio.run_coroutine_threadsafe(
-                self.__function_client.get_function_result_by_request_id_async(
-                    region_id = self.__function_metadata['region_id'],
-                    namespace_name = self.__function_metadata['namespace_name'],
-                    function_name = self.__function_metadata['function_name'],
-                    function_request_id = self.__function_request_id,
-                    function_version = self.__function_metadata['function_version']
-                ),
-                self.__function_client.get_event_loop())
-
-            result_future.add_done_callback(self._complete_callback)
-        else:
-            if result_future.exception():
-                if isinstance(result_future.exception(), errors.errors.NotFoundError):
-                    self.__function_client.get_event_loop().call_later(1, self._complete_callback)
-                else:
-                    self.set_exception(result_future.exception())
+        '''
 
-                return
+        if self.done():
+            return
 
-            function_result: dict = result_future.result()
+        if result_future.cancelled():
+            self.cancel()
+            return
 
-            if not function_result['is_successful']:
-                self.set_exception(errors.InvokeError(
-                    error_message = function_result['return_result'],
-                    request_id = self.__function_request_id
-                ))
-            
-            self.set_result(helper.inferred_return_result(
-                function_result['return_result']))
+        if result_future.exception():
+            self.set_exception(result_future.exception())
+            return
+
+        self.set_result(result_future.result())
 
-            self.done()
+    def cancel(self, *args, **kwargs) -> bool:
+        if self.__result_future:
+            self.__result_future.cancel()
+
+        return super().cancel(*args, **kwargs)
 
     def __await__(self):
-        self._complete_callback(None)
+        # The result is fetched by a single task, which is
+        # created the first time this future is awaited.
+        if not self.__result_future:
+            client_event_loop: asyncio.AbstractEventLoop = (
+                self.__function_client._get_event_loop())
+
+            result_coroutine: object = _wait_function_result_async(
+                self.__function_client,
+                self.__function_metadata['region_id'],
+                self.__function_metadata['namespace_name'],
+                self.__function_metadata['function_name'],
+                self.__function_metadata['function_version'],
+                self.__function_request_id
+            )
+
+            if asyncio.get_event_loop() is client_event_loop:
+                self.__result_future = client_event_loop.create_task(
+                    result_coroutine)
+            else:
+                # Awaited from an event loop other than the one of the
+                # client, the task must be handed over thread-safely.
+                self.__result_future = asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(
+                        result_coroutine, client_event_loop))
+
+            self.__result_future.add_done_callback(self._complete_callback)
+
         return super().__await__()
     
     def get_request_id(self) -> str:
@@ -147,50 +288,74 @@ class FunctionSchedule:
     An invoke scheduled task representing a Cloud Function.
 
     Note that this type should not be instantiated
-        directly unless necessary.
+        directly unless necessary. The constructor
+        parameters other than the callback context are
+        not validated when Python runs with optimizations
+        enabled (python -O).
     '''
+
+    __slots__ = (
+        '__function_client',
+        '__invoke_arguments',
+        '__invoke_timestamp',
+        '__schedule_created_callback',
+        '__schedule_invoked_callback',
+        '__schedule_completed_callback',
+        '__invoke_future',
+        '__invoke_cancelled',
+        '__invoke_completed',
+        '__invoke_result',
+        '__invoke_exception'
+    )
     
     def __init__(self,
-        function_client: client.AbstractClient,
+        function_client: 'Client',
         invoke_context: dict,
         invoke_timestamp: int,
         callback_context: dict = None
     ):
-        if not function_client or not isinstance(function_client, client.AbstractClient):
-            raise ValueError('<function_client> value invalid')
+        if __debug__:
+            if not function_client or not isinstance(function_client, Client):
+                raise ValueError('<function_client> value invalid')
 
-        if not invoke_context or not isinstance(invoke_context, dict):
-            raise ValueError('<invoke_context> value invalid')
+            if not invoke_context or not isinstance(invoke_context, dict):
+                raise ValueError('<invoke_context> value invalid')
 
-        if not invoke_timestamp or not isinstance(invoke_timestamp, int):
-            raise ValueError('<invoke_timestamp> value invalid')
-        
+            if not invoke_timestamp or not isinstance(invoke_timestamp, int):
+                raise ValueError('<invoke_timestamp> value invalid')
+
+        # The callback context is checked regardless of optimizations,
+        # the scheduler reads it for every scheduled invoke task.
         if not callback_context or not isinstance(callback_context, dict):
             raise ValueError('<callback_context> value invalid')
 
-        self.__function_client: client.AbstractClient = function_client
-        self.__invoke_context: dict = invoke_context
+        self.__function_client: Client = function_client
         self.__invoke_timestamp: int = invoke_timestamp
 
-        try:
-            self.__schedule_created_callback: object = callback_context['created']
-            self.__schedule_invoked_callback: object = callback_context['invoked']
-            self.__schedule_completed_callback: object = callback_context['completed']
-        except KeyError as error:
-            raise ValueError('<callback_context> missing field: ' + str(error))
+        # The invoke context is converted to the positional arguments of
+        # the client invoke method once, rather than when it is due.
+        self.__invoke_arguments: tuple = (
+            invoke_context['region_id'],
+            invoke_context['namespace_name'],
+            invoke_context['function_name'],
+            invoke_context.get('function_event'),
+            invoke_context.get('function_version'),
+            invoke_context.get('function_async', False)
+        )
 
-        self.__invoke_future: asyncio.Future = None
-        self.__invoke_handle: asyncio.TimerHandle = None
+        self.__schedule_created_callback: object = callback_context.get('created')
+        self.__schedule_invoked_callback: object = callback_context.get('invoked')
+        self.__schedule_completed_callback: object = callback_context.get('completed')
 
-        current_unix_timestamp: int = int(time.time())
+        self.__invoke_future: asyncio.Future = None
+        self.__invoke_cancelled: bool = False
 
-        if invoke_timestamp <= current_unix_timestamp:
-            raise ValueError('<invoke_timestamp> value invalid')
+        # The outcome of the invoke is recorded once it has completed.
+        self.__invoke_completed: bool = False
+        self.__invoke_result: dict = None
+        self.__invoke_exception: BaseException = None
 
-        self.__function_client.get_event_loop().call_later(
-            delay = invoke_timestamp - current_unix_timestamp,
-            callback = self._invoke_callback
-        )
+        self.__function_client._push_schedule(self, invoke_timestamp)
 
         if self.__schedule_created_callback:
             self.__schedule_created_callback(self)
@@ -203,9 +368,31 @@ class FunctionSchedule:
             object associated with the Cloud Function.
         '''
 
-        self.__invoke_future = self.__function_client.get_event_loop().create_task(
-            self.__function_client.invoke_async(**self.__invoke_context)
-        )
+        if self.__invoke_cancelled:
+            return
+
+        event_loop: asyncio.AbstractEventLoop = self.__function_client._get_event_loop()
+
+        try:
+            invoke_coroutine: object = self.__function_client.invoke_async(
+                *self.__invoke_arguments)
+
+            if _EAGER_TASK_START:
+                # Run the invoke up to its first request right away
+                # instead of queueing its first step behind this callback.
+                self.__invoke_future = asyncio.Task(invoke_coroutine,
+                    loop = event_loop, eager_start = True)
+            else:
+                self.__invoke_future = event_loop.create_task(invoke_coroutine)
+        except Exception as error:
+            # The invoke could not be started, it completes with the
+            # error so that the schedule is still accounted as completed.
+            failed_future: asyncio.Future = event_loop.create_future()
+            failed_future.set_exception(error)
+
+            self.__invoke_future = failed_future
+            self._completed_callback(failed_future)
+            return
 
         self.__invoke_future.add_done_callback(self._completed_callback)
 
@@ -216,13 +403,18 @@ class FunctionSchedule:
         Cloud Function invoke completes the callback method.
         '''
 
-        if invoke_result_future.exception():
-            if not self.__schedule_invoked_callback:
-                raise invoke_result_future.exception()
+        self.__invoke_exception = invoke_result_future.exception()
+
+        if not self.__invoke_exception:
+            self.__invoke_result = invoke_result_future.result()
+
+        self.__invoke_completed = True
 
         try:
             if self.__schedule_invoked_callback:
                 self.__schedule_invoked_callback(self)
+            elif self.__invoke_exception:
+                raise self.__invoke_exception
         finally:
             if self.__schedule_completed_callback:
                 self.__schedule_completed_callback(self)
@@ -232,27 +424,48 @@ class FunctionSchedule:
         Try canceling a Cloud Function scheduled invoke task.
 
         Raises:
-            StatusError: Invoke task has started
+            StatusError: Invoke task has started or has been cancelled
         '''
 
         if self.__invoke_future:
             raise errors.StatusError('invoke has started')
 
-        self.__invoke_handle.cancel()
+        if self.__invoke_cancelled:
+            raise errors.StatusError('invoke has been cancelled')
+
+        # The task stays in the schedule heap of the client
+        # and is skipped once it becomes due.
+        self.__invoke_cancelled = True
 
         if self.__schedule_completed_callback:
             self.__schedule_completed_callback(self)
 
+    def _check_completed(self):
+        '''
+        Internal method: Check that the invoke task has completed.
+
+        Raises:
+            StatusError: Invoke task has not started or completed
+        '''
+
+        if not self.__invoke_future:
+            raise errors.StatusError('invoke has not started')
+
+        if not self.__invoke_completed:
+            raise errors.StatusError('invoke has not completed')
+
     @property
     def is_successful(self) -> bool:
         '''
         Whether Invoke was successful
+
+        Raises:
+            StatusError: Invoke task has not started or completed
         '''
 
-        if not self.__invoke_future:
-            raise errors.StatusError('invoke has not started')
+        self._check_completed()
 
-        return self.__invoke_future.exception() == None
+        return self.__invoke_exception is None
     
     @property
     def exception(self) -> errors.errors.Error:
@@ -260,13 +473,12 @@ class FunctionSchedule:
         An instance of the exception thrown by Invoke.
 
         Raises:
-            StatusError: Invoke task has not started
+            StatusError: Invoke task has not started or completed
         '''
 
-        if not self.__invoke_future:
-            raise errors.StatusError('invoke has not started')
+        self._check_completed()
 
-        return self.__invoke_future.exception()
+        return self.__invoke_exception
     
     @property
     def result(self) -> dict:
@@ -274,13 +486,15 @@ class FunctionSchedule:
         Dictionary object for invoke results
 
         Raises:
-            StatusError: Invoke task has not started
+            StatusError: Invoke task has not started or completed
         '''
 
-        if not self.__invoke_future:
-            raise errors.StatusError('invoke has not started')
+        self._check_completed()
 
-        return self.__invoke_future.result()
+        if self.__invoke_exception:
+            raise self.__invoke_exception
+
+        return self.__invoke_result
     
     @property
     def return_value(self) -> object:
@@ -292,11 +506,85 @@ class FunctionSchedule:
             convert it to a Python native data type.
 
         Raises:
-            StatusError: Invoke task has not started
+            StatusError: Invoke task has not started or completed
         '''
 
         return helper.inferred_return_result(self.result['return_result'])
 
+class _FunctionInvokeStub:
+    '''
+    Internal type: A callable that invokes a given Cloud Function,
+        with the keyword arguments of the call as the invoke event.
+    '''
+
+    __slots__ = (
+        '_invoke_method',
+        '_region_id',
+        '_namespace_name',
+        '_function_name',
+        '_function_version',
+        '_function_async'
+    )
+
+    def __init__(self,
+        invoke_method: object,
+        region_id: str,
+        namespace_name: str,
+        function_name: str,
+        function_version: str,
+        function_async: bool
+    ):
+        self._invoke_method: object = invoke_method
+        self._region_id: str = region_id
+        self._namespace_name: str = namespace_name
+        self._function_name: str = function_name
+        self._function_version: str = function_version
+        self._function_async: bool = function_async
+
+    def __call__(self, **function_event) -> object:
+        return self._invoke_method(self._region_id, self._namespace_name,
+            self._function_name, function_event, self._function_version,
+            self._function_async)
+
+class _RoutineInvokeStub:
+    '''
+    Internal type: A callable that invokes a given routine of a given
+        Cloud Function, with the keyword arguments of the call as the
+        routine parameters.
+    '''
+
+    __slots__ = (
+        '_invoke_method',
+        '_region_id',
+        '_namespace_name',
+        '_function_name',
+        '_routine_name',
+        '_function_version',
+        '_function_async'
+    )
+
+    def __init__(self,
+        invoke_method: object,
+        region_id: str,
+        namespace_name: str,
+        function_name: str,
+        routine_name: str,
+        function_version: str,
+        function_async: bool
+    ):
+        self._invoke_method: object = invoke_method
+        self._region_id: str = region_id
+        self._namespace_name: str = namespace_name
+        self._function_name: str = function_name
+        self._routine_name: str = routine_name
+        self._function_version: str = function_version
+        self._function_async: bool = function_async
+
+    def __call__(self, **routine_parameter) -> object:
+        return self._invoke_method(self._region_id, self._namespace_name,
+            self._function_name, self._routine_name, routine_parameter,
+            self._function_version, self._function_async)
+
 class Client(client.AbstractClient):
     '''
     Abstract client type representing Serverless Cloud Function products.
@@ -313,11 +601,27 @@ class Client(client.AbstractClient):
         access_credentials: credentials.Credentials = None,
         access_proxies: proxies.Proxies = None
     ):
-        self.__schedule_invoke_waited: bool = False
         self.__schedule_invoke_count: int = 0
 
+        # Scheduled invoke tasks are kept in a heap of tuples
+        # (invoke_time, sequence, task) and fired by a single timer,
+        # the invoke time is based on the event loop clock. The sequence
+        # keeps tasks with the same invoke time in submission order.
+        self.__schedule_heap: list = list()
+        self.__schedule_sequence: itertools.count = itertools.count()
+        self.__schedule_handle: asyncio.TimerHandle = None
+        self.__schedule_handle_time: float = None
+
         super().__init__(access_credentials, access_proxies)
 
+        # Offset (in seconds) from the event loop clock to UNIX time,
+        # captured once so that scheduling does not read the wall clock.
+        self.__unix_time_offset: float = time.time() - self._get_event_loop().time()
+
+        # Set once all scheduled invoke tasks have completed, it is
+        # created here so that it belongs to the event loop of the client.
+        self.__schedule_completed_event: asyncio.Event = asyncio.Event()
+
     async def easy_invoke_async(self,
         region_id: str,
         namespace_name: str,
@@ -352,17 +656,12 @@ class Client(client.AbstractClient):
             
             return helper.inferred_return_result(invoke_result['return_result'])
         else:
-            return await FunctionResultFuture(
-                function_client = self,
-                function_metadata = {
-                    'region_id': region_id,
-                    'namespace_name': namespace_name,
-                    'function_name': function_name,
-                    'function_version': function_version
-                },
-                function_request_id = (await self.invoke_async(region_id, namespace_name,
-                    function_name, function_event, function_version, True))['request_id']
-            )
+            function_request_id: str = (await self.invoke_async(region_id, namespace_name,
+                function_name, function_event, function_version, True))['request_id']
+
+            return await _wait_function_result_async(self, region_id,
+                namespace_name, function_name, function_version,
+                function_request_id)
 
     def easy_invoke(self,
         region_id: str,
@@ -399,6 +698,62 @@ class Client(client.AbstractClient):
             return (self._get_event_loop().run_until_complete(self.invoke_async(region_id,
                 namespace_name, function_name, function_event, function_version, True))['request_id'])
 
+    async def easy_invoke_many_async(self,
+        invoke_contexts: list,
+        max_concurrency: int = 16
+    ) -> list:
+        '''
+        Concurrently invoke the given Cloud Functions, at most the given
+            number of invokes are in progress at the same time.
+
+        If any invoke fails, the invokes still in progress or waiting
+            are cancelled and the exception of the first failed invoke
+            is raised.
+
+        Args:
+            invoke_contexts: List of dictionaries of the keyword arguments
+                of method easy_invoke_async, one for each invoke.
+            max_concurrency: Maximum number of concurrent invokes,
+                the value must be greater than 0.
+
+        Returns:
+            Returns a list of the automatically inferred Cloud Function
+                return values, in the order of the given invoke contexts.
+
+        Raises:
+            ValueError: Parameter values are not as expected.
+            InvokeError: Invoke Cloud Function failed.
+            ActionError: Invoke Cloud Function error.
+        '''
+
+        if not isinstance(invoke_contexts, list):
+            raise ValueError('<invoke_contexts> value invalid')
+
+        if not isinstance(max_concurrency, int) or max_concurrency <= 0:
+            raise ValueError('<max_concurrency> value invalid')
+
+        invoke_semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded_invoke(
+            invoke_context: dict
+        ) -> object:
+            async with invoke_semaphore:
+                return await self.easy_invoke_async(**invoke_context)
+
+        invoke_tasks: list = [asyncio.ensure_future(_bounded_invoke(invoke_context))
+            for invoke_context in invoke_contexts]
+
+        try:
+            return await asyncio.gather(*invoke_tasks)
+        except BaseException:
+            # Cancel the remaining invokes and wait for them to exit,
+            # so that none of them is left running unattended.
+            for invoke_task in invoke_tasks:
+                invoke_task.cancel()
+
+            await asyncio.gather(*invoke_tasks, return_exceptions = True)
+            raise
+
     async def routine_invoke_async(self,
         region_id: str,
         namespace_name: str,
@@ -440,12 +795,7 @@ class Client(client.AbstractClient):
             function_name, {
                 'protocol': {
                     'version': 1,
-                    'payload': base64.b64encode(json.dumps(
-                        {
-                            'routine_name': routine_name,
-                            'routine_parameter': routine_parameter
-                        }
-                    ).encode()).decode()
+                    'payload': _get_routine_payload(routine_name, routine_parameter)
                 }
             }, function_version, function_async)
     
@@ -507,8 +857,8 @@ class Client(client.AbstractClient):
             Returns a Python native asynchronous function instance.
         '''
 
-        return (lambda **function_event: self.easy_invoke_async(region_id, namespace_name,
-            function_name, function_event, function_version, function_async))
+        return _FunctionInvokeStub(self.easy_invoke_async, region_id,
+            namespace_name, function_name, function_version, function_async)
 
     def select_function(self,
         region_id: str,
@@ -532,8 +882,8 @@ class Client(client.AbstractClient):
             Returns a Python native synchronous function instance.
         '''
 
-        return (lambda **function_event: self.easy_invoke(region_id,
-            namespace_name, function_name, function_event, function_version, function_async))
+        return _FunctionInvokeStub(self.easy_invoke, region_id,
+            namespace_name, function_name, function_version, function_async)
 
     async def select_routine_async(self,
         region_id: str,
@@ -559,10 +909,9 @@ class Client(client.AbstractClient):
             Returns a Python native asynchronous function instance.
         '''
 
-        return (lambda **routine_parameter: self.routine_invoke_async(
-            region_id, namespace_name, function_name, routine_name,
-            routine_parameter, function_version, function_async
-        ))
+        return _RoutineInvokeStub(self.routine_invoke_async, region_id,
+            namespace_name, function_name, routine_name, function_version,
+            function_async)
     
     def select_routine(self,
         region_id: str,
@@ -588,10 +937,9 @@ class Client(client.AbstractClient):
             Returns a Python native synchronous function instance.
         '''
 
-        return (lambda **routine_parameter: self.routine_invoke(
-            region_id, namespace_name, function_name, routine_name,
-            routine_parameter, function_version, function_async
-        ))
+        return _RoutineInvokeStub(self.routine_invoke, region_id,
+            namespace_name, function_name, routine_name, function_version,
+            function_async)
 
     def bind_function(self,
         region_id: str,
@@ -635,28 +983,43 @@ class Client(client.AbstractClient):
             if not bound_function or not callable(bound_function):
                 raise TypeError('invalid binding object type')
 
-            def invoke_handler(*args, **kwargs):
-                function_event: dict = dict()
-                parameter_names: list = inspect.getfullargspec(bound_function).args
+            # The signature of the bound object does not change, so it
+            # is inspected once here rather than on every invoke.
 
-                if len(parameter_names) > 0:
-                    if parameter_names[0] == 'self' or parameter_names[0] == 'cls':
-                        if include_attributes:
-                            for name in include_attributes:
-                                function_event[name] = getattr(args[0], name)
+            parameter_names: list = inspect.getfullargspec(bound_function).args
+            is_bound_method: bool = (len(parameter_names) > 0 and
+                (parameter_names[0] == 'self' or parameter_names[0] == 'cls'))
 
-                        del parameter_names[0]
-                        args = args[1 : ]
+            if is_bound_method:
+                parameter_names = parameter_names[1 : ]
 
-                for index, value in enumerate(args):
-                    function_event[parameter_names[index]] = value
+            method_instance: object = (self.easy_invoke_async if
+                inspect.iscoroutinefunction(bound_function) else self.easy_invoke)
 
-                for name in kwargs:
-                    function_event[name] = kwargs[name]
+            def invoke_handler(*args, **kwargs):
+                if is_bound_method:
+                    function_event: dict = ({ name: getattr(args[0], name)
+                        for name in include_attributes } if include_attributes else dict())
+
+                    args = args[1 : ]
+                elif not args:
+                    # The keyword arguments are a new dictionary
+                    # for each call, so it is used as is.
+                    function_event: dict = kwargs
+                else:
+                    function_event: dict = dict()
 
-                return (self.easy_invoke_async if inspect.iscoroutinefunction(bound_function)
-                    else self.easy_invoke)(region_id, namespace_name, function_name,
-                        function_event, function_version, function_async)
+                if args:
+                    if len(args) > len(parameter_names):
+                        raise TypeError('too many positional arguments')
+
+                    function_event.update(zip(parameter_names, args))
+
+                if function_event is not kwargs:
+                    function_event.update(kwargs)
+
+                return method_instance(region_id, namespace_name, function_name,
+                    function_event, function_version, function_async)
 
             return invoke_handler
 
@@ -702,24 +1065,116 @@ class Client(client.AbstractClient):
             method_instance: object = (self.routine_invoke_async if
                 inspect.iscoroutinefunction(bound_function) else self.routine_invoke)
 
-            def invoke_handler(*args, **kwargs):
-                routine_parameter: dict = dict()
-                parameter_names: list = inspect.getfullargspec(bound_function).args
+            parameter_names: list = inspect.getfullargspec(bound_function).args
+            bound_routine_name: str = routine_name if routine_name else bound_function.__name__
 
-                for index, value in enumerate(args):
-                    routine_parameter[parameter_names[index]] = value
+            def invoke_handler(*args, **kwargs):
+                if not args:
+                    # The keyword arguments are a new dictionary
+                    # for each call, so it is used as is.
+                    routine_parameter: dict = kwargs
+                else:
+                    if len(args) > len(parameter_names):
+                        raise TypeError('too many positional arguments')
 
-                for name in kwargs:
-                    routine_parameter[name] = kwargs[name]
+                    routine_parameter: dict = dict(zip(parameter_names, args))
+                    routine_parameter.update(kwargs)
 
                 return method_instance(region_id, namespace_name, function_name,
-                    routine_name if routine_name else bound_function.__name__,
-                    routine_parameter, function_version, function_async)
+                    bound_routine_name, routine_parameter, function_version, function_async)
 
             return invoke_handler
 
         return decorator_handler
 
+    def _get_unix_timestamp(self) -> float:
+        '''
+        Internal method: Get the current UNIX timestamp derived
+            from the event loop clock of the client.
+        '''
+
+        return self._get_event_loop().time() + self.__unix_time_offset
+
+    def _push_schedule(self,
+        function_schedule: FunctionSchedule,
+        invoke_timestamp: int
+    ):
+        '''
+        Internal method: Add a scheduled invoke task to the schedule heap,
+            and rearm the schedule timer if the task is the earliest.
+            A task that is already due is invoked as soon as possible.
+        '''
+
+        event_loop: asyncio.AbstractEventLoop = self._get_event_loop()
+        invoke_time: float = invoke_timestamp - self.__unix_time_offset
+
+        if invoke_time <= event_loop.time():
+            # The task is already due, it is invoked as soon as
+            # possible without going through the schedule heap.
+            event_loop.call_soon(function_schedule._invoke_callback)
+            return
+
+        heapq.heappush(self.__schedule_heap, (invoke_time,
+            next(self.__schedule_sequence), function_schedule))
+
+        if (self.__schedule_handle is None or
+            invoke_time < self.__schedule_handle_time
+        ):
+            self._arm_schedule_timer()
+
+    def _arm_schedule_timer(self):
+        '''
+        Internal method: Arm the schedule timer for the earliest
+            scheduled invoke task in the schedule heap.
+        '''
+
+        if self.__schedule_handle:
+            self.__schedule_handle.cancel()
+            self.__schedule_handle = None
+
+        if not self.__schedule_heap:
+            return
+
+        invoke_time: float = self.__schedule_heap[0][0]
+
+        self.__schedule_handle_time = invoke_time
+        self.__schedule_handle = self._get_event_loop().call_at(
+            invoke_time, self._drain_schedules)
+
+    def _drain_schedules(self):
+        '''
+        Internal method: Schedule timer callback method, invokes all
+            scheduled invoke tasks that are due and rearms the timer.
+        '''
+
+        self.__schedule_handle = None
+
+        event_loop: asyncio.AbstractEventLoop = self._get_event_loop()
+
+        # The event loop may fire the timer within its clock resolution
+        # before the armed time, the tasks of the armed time are due.
+        current_time: float = max(event_loop.time(),
+            self.__schedule_handle_time)
+
+        schedule_heap: list = self.__schedule_heap
+
+        try:
+            while schedule_heap and schedule_heap[0][0] <= current_time:
+                function_schedule: FunctionSchedule = heapq.heappop(schedule_heap)[2]
+
+                try:
+                    function_schedule._invoke_callback()
+                except Exception as error:
+                    # An error of one task must not keep the remaining
+                    # due tasks from being invoked, it is reported to
+                    # the exception handler of the event loop instead.
+                    event_loop.call_exception_handler({
+                        'message': 'scheduled invoke task callback error',
+                        'exception': error
+                    })
+        finally:
+            self._arm_schedule_timer()
+
     def _schedule_created_callback(self,
         function_schedule: FunctionSchedule
     ):
@@ -728,6 +1183,7 @@ class Client(client.AbstractClient):
         '''
 
         self.__schedule_invoke_count += 1
+        self.__schedule_completed_event.clear()
 
     def _schedule_completed_callback(self,
         function_schedule: FunctionSchedule
@@ -736,17 +1192,14 @@ class Client(client.AbstractClient):
         A callback method that timing a invoked task that has completed
             or been cancelled.
         
-        If all timed invoke tasks have completed and the instance method
-            run_schedule is being called, the method will attempt to stop
-            the event loop to release the instance method run_schedule.
+        If all timed invoke tasks have completed, the method will set the
+            schedule completed event to release the instance method run_schedule.
         '''
 
         self.__schedule_invoke_count -= 1
 
-        if (self.__schedule_invoke_waited and
-            self.__schedule_invoke_count == 0
-        ):
-            self._get_event_loop().stop()
+        if not self.__schedule_invoke_count:
+            self.__schedule_completed_event.set()
 
     def schedule_invoke(self,
         region_id: str,
@@ -768,7 +1221,8 @@ class Client(client.AbstractClient):
             function_event: Cloud Function invoke event.
             function_version: Cloud Function version.
             function_async: Make Cloud Function asynchronous invoke.
-            invoke_timestamp: Specifies the native UNIX timestamp at which invoke begins.
+            invoke_timestamp: Specifies the native UNIX timestamp at which invoke begins,
+                a timestamp that has already passed invokes as soon as possible.
             invoked_callback: Callback function after Invoke is over.
         
         Returns:
@@ -779,7 +1233,7 @@ class Client(client.AbstractClient):
         '''
 
         if not invoke_timestamp:
-            invoke_timestamp = int(time.time()) + 3
+            invoke_timestamp = int(self._get_unix_timestamp()) + 3
         else:
             if not isinstance(invoke_timestamp, int):
                 raise ValueError('<invoke_timestamp> value invalid')
@@ -817,17 +1271,65 @@ class Client(client.AbstractClient):
         if self.__schedule_invoke_count < 1:
             raise errors.StatusError('no scheduled invoke tasks')
 
-        if self._get_event_loop().is_running():
+        event_loop: asyncio.AbstractEventLoop = self._get_event_loop()
+
+        if event_loop.is_running():
             raise errors.StatusError('cannot be run repeatedly')
 
-        self.__schedule_invoke_waited = True
+        event_loop.run_until_complete(self.__schedule_completed_event.wait())
 
-        try:
-            self._get_event_loop().run_forever()
-        finally:
-            self.__schedule_invoke_waited = False
+@functools.lru_cache(maxsize = 1)
+def _get_default_region_id() -> str:
+    '''
+    Internal function: Get and cache the unique identifier of the Region
+        where the current Serverless Cloud Function is located, the
+        environment of a container instance never changes.
+
+    The cached value is interned, it is compared and hashed on the
+        request path of every invoke that falls back to it.
+    '''
+
+    return sys.intern(helper.get_cloud_function_region_id())
+
+@functools.lru_cache(maxsize = 1)
+def _get_default_namespace_name() -> str:
+    '''
+    Internal function: Get and cache the name of the namespace where
+        the current Serverless Cloud Function is located.
+    '''
+
+    return sys.intern(helper.get_cloud_function_namespace_name())
+
+class _ThreadLocalAttributes(threading.local):
+    '''
+    Internal type: Built-in client instance storage of the current
+        hyper-threading. Unset attributes fall back to the class level
+        defaults, so the built-in client is read with a single attribute
+        lookup instead of hasattr() followed by an attribute lookup.
+
+    The bound invoke methods of the built-in client are kept alongside
+        it, so invoke() and invoke_async() do not resolve the method on
+        every call.
+    '''
 
-__thread_local_attributes: threading.local = threading.local()
+    builtin_client: Client = None
+    builtin_easy_invoke: object = None
+    builtin_easy_invoke_async: object = None
+
+__thread_local_attributes: _ThreadLocalAttributes = _ThreadLocalAttributes()
+
+def _bind_builtin_client(
+    function_client: Client
+):
+    '''
+    Internal function: Set the given client instance and its bound
+        invoke methods as the built-in ones of the current hyper-threading.
+    '''
+
+    __thread_local_attributes.builtin_client = function_client
+    __thread_local_attributes.builtin_easy_invoke = function_client.easy_invoke
+    __thread_local_attributes.builtin_easy_invoke_async = (
+        function_client.easy_invoke_async)
 
 def fetch_client() -> Client:
     '''
@@ -841,12 +1343,13 @@ def fetch_client() -> Client:
         Returns a serverless cloud function product client instance.
     '''
 
-    global __thread_local_attributes
+    function_client: Client = __thread_local_attributes.builtin_client
 
-    if not hasattr(__thread_local_attributes, 'builtin_client'):
-        __thread_local_attributes.builtin_client = Client()
+    if function_client is None:
+        function_client = Client()
+        _bind_builtin_client(function_client)
 
-    return __thread_local_attributes.builtin_client
+    return function_client
 
 def set_client(
     function_client: Client
@@ -862,11 +1365,11 @@ def set_client(
         ValueError: The parameter value is not as expected.
     '''
 
-    if not function_client or not isinstance(function_client, Client):
-        raise ValueError('<function_client> value invalid')
+    if __debug__:
+        if not function_client or not isinstance(function_client, Client):
+            raise ValueError('<function_client> value invalid')
 
-    global __thread_local_attributes
-    __thread_local_attributes.builtin_client = function_client
+    _bind_builtin_client(function_client)
 
 def destroy_client():
     '''
@@ -878,12 +1381,12 @@ def destroy_client():
             client instance has ever been created.
     '''
 
-    global __thread_local_attributes
-
-    if not hasattr(__thread_local_attributes, 'builtin_client'):
+    if __thread_local_attributes.builtin_client is None:
         raise UnboundLocalError('no such builtin client')
     
-    del __thread_local_attributes.builtin_client
+    __thread_local_attributes.builtin_client = None
+    __thread_local_attributes.builtin_easy_invoke = None
+    __thread_local_attributes.builtin_easy_invoke_async = None
 
 def invoke(
     function_name: str,
@@ -921,15 +1424,20 @@ def invoke(
     '''
     
     if not region_id:
-        region_id = helper.get_cloud_function_region_id()
+        region_id = _get_default_region_id()
     
     if not namespace_name:
-        namespace_name = helper.get_cloud_function_namespace_name()
+        namespace_name = _get_default_namespace_name()
+
+    easy_invoke: object = __thread_local_attributes.builtin_easy_invoke
 
-    return fetch_client().easy_invoke(region_id, namespace_name,
-        function_name, function_event, function_version, function_async)
+    if easy_invoke is None:
+        easy_invoke = fetch_client().easy_invoke
 
-async def invoke_async(
+    return easy_invoke(region_id, namespace_name, function_name,
+        function_event, function_version, function_async)
+
+def invoke_async(
     function_name: str,
     function_event: dict = None,
     function_version: str = None,
@@ -947,6 +1455,10 @@ async def invoke_async(
     The current Cloud Function must be configured with a valid execution
         role, otherwise an EnvironmentError exception will be thrown.
 
+    Note that the default Region and namespace are resolved and the
+        built-in client is fetched when this function is called, the
+        returned coroutine object only performs the invoke.
+
     Args:
         function_name: Cloud Function name.
         function_event: Cloud Function invoke event.
@@ -956,7 +1468,8 @@ async def invoke_async(
         namespace_name: Name of the owning namespace.
         
     Returns:
-        Returns the automatically inferred Cloud Function return value.
+        Returns a coroutine object that resolves to the automatically
+            inferred Cloud Function return value.
         
     Raises:
         ValueError: Parameter values are not as expected.
@@ -965,14 +1478,79 @@ async def invoke_async(
     '''
 
     if not region_id:
-        region_id = helper.get_cloud_function_region_id()
+        region_id = _get_default_region_id()
     
     if not namespace_name:
-        namespace_name = helper.get_cloud_function_namespace_name()
+        namespace_name = _get_default_namespace_name()
 
-    return await fetch_client().easy_invoke_async(region_id,
-        namespace_name, function_name, function_event,
-        function_version, function_async)
+    easy_invoke_async: object = __thread_local_attributes.builtin_easy_invoke_async
+
+    if easy_invoke_async is None:
+        easy_invoke_async = fetch_client().easy_invoke_async
+
+    return easy_invoke_async(region_id, namespace_name, function_name,
+        function_event, function_version, function_async)
+
+async def invoke_many_async(
+    function_name: str,
+    function_events: list,
+    function_version: str = None,
+    function_async: bool = False,
+    namespace_name: str = None,
+    region_id: str = None,
+    max_concurrency: int = 16
+) -> list:
+    '''
+    Concurrently invoke specifies a Cloud Function once for each
+        of the given invoke events, at most the given number of
+        invokes are in progress at the same time.
+
+    Note that the default Region and namespace are resolved and the
+        built-in client is fetched only once for all invokes.
+
+    If any invoke fails, the invokes still in progress or waiting
+        are cancelled and the exception of the first failed invoke
+        is raised, see Client.easy_invoke_many_async.
+
+    Args:
+        function_name: Cloud Function name.
+        function_events: List of Cloud Function invoke events.
+        function_version: Cloud Function version.
+        function_async: Make Cloud Function asynchronous invoke.
+        region_id: Unique identifier of the data center campus.
+        namespace_name: Name of the owning namespace.
+        max_concurrency: Maximum number of concurrent invokes,
+            the value must be greater than 0.
+
+    Returns:
+        Returns a list of the automatically inferred Cloud Function
+            return values, in the order of the given invoke events.
+
+    Raises:
+        ValueError: Parameter values are not as expected.
+        InvokeError: Invoke Cloud Function failed.
+        ActionError: Invoke Cloud Function error.
+    '''
+
+    if not isinstance(function_events, list):
+        raise ValueError('<function_events> value invalid')
+
+    if not region_id:
+        region_id = _get_default_region_id()
+
+    if not namespace_name:
+        namespace_name = _get_default_namespace_name()
+
+    return await fetch_client().easy_invoke_many_async([
+        {
+            'region_id': region_id,
+            'namespace_name': namespace_name,
+            'function_name': function_name,
+            'function_event': function_event,
+            'function_version': function_version,
+            'function_async': function_async
+        } for function_event in function_events
+    ], max_concurrency)
 
 def use_routine_dispatcher(
     override_handler: bool = True
@@ -999,14 +1577,15 @@ def use_routine_dispatcher(
             the current function call originated.
     '''
 
-    if override_handler == None or not isinstance(override_handler, bool):
-        raise ValueError('<override_handler> value invalid')
+    if __debug__:
+        if override_handler == None or not isinstance(override_handler, bool):
+            raise ValueError('<override_handler> value invalid')
 
     integrate_dispatch: IntegrateDispatch = IntegrateDispatch()
 
     if override_handler:
         try:
-            module_name: str = inspect.currentframe().f_back.f_globals['__name__']
+            module_name: str = sys._getframe(1).f_globals['__name__']
             setattr(sys.modules[module_name], 'main', integrate_dispatch.handler)
         except KeyError:
             raise ModuleNotFoundError('no call source module found')
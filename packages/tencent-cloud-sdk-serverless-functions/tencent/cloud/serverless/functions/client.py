@@ -2715,8 +2715,7 @@ class AbstractClient(client.UniversalClient):
                         info['version'])
                 )
 
-            await asyncio.gather(*delete_coroutines,
-                loop = self._get_event_loop())
+            await asyncio.gather(*delete_coroutines)
 
             return len(delete_coroutines)
 
@@ -21,8 +21,12 @@
 def run_unit_tests():
     from tests.cloud.serverless.functions import errors
     from tests.cloud.serverless.functions import helper
+    from tests.cloud.serverless.functions import payload
+    from tests.cloud.serverless.functions import schedule
     from tests.cloud.serverless.functions import client
 
     errors.run_unit_tests()
     helper.run_unit_tests()
+    payload.run_unit_tests()
+    schedule.run_unit_tests()
     client.run_unit_tests()
@@ -0,0 +1,94 @@
+# Copyright (c) 2022 MIEK
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys
+import json
+import uuid
+import base64
+import datetime
+import importlib
+
+def _decode_routine_payload(
+    routine_payload: str
+) -> dict:
+    return json.loads(base64.b64decode(routine_payload))
+
+def _get_routine_payloads(
+    functions: object
+) -> list:
+    routine_payloads: list = list()
+
+    for routine_parameter in (
+        { 'value': float('nan') },
+        { 'value': float('inf') },
+        { 'value': float('-inf') },
+        { 'value': datetime.datetime(2022, 1, 1) },
+        { 'value': datetime.date(2022, 1, 1) },
+        { 'value': uuid.UUID(int = 0) }
+    ):
+        try:
+            routine_payloads.append(functions._get_routine_payload(
+                'hello', routine_parameter))
+        except TypeError:
+            routine_payloads.append(TypeError)
+
+    return routine_payloads
+
+def run_unit_tests():
+    from tencent.cloud.serverless import functions
+
+    routine_payload: dict = _decode_routine_payload(
+        functions._get_routine_payload('hello', { 'value': float('nan') }))
+
+    assert routine_payload['routine_name'] == 'hello'
+    assert routine_payload['routine_parameter']['value'] != routine_payload[
+        'routine_parameter']['value']
+
+    assert _decode_routine_payload(functions._get_routine_payload(
+        'hello', { 'value': float('inf') }))['routine_parameter']['value'] == float('inf')
+
+    for routine_parameter in (
+        { 'value': datetime.datetime(2022, 1, 1) },
+        { 'value': datetime.date(2022, 1, 1) },
+        { 'value': uuid.UUID(int = 0) }
+    ):
+        try:
+            functions._get_routine_payload('hello', routine_parameter)
+        except TypeError:
+            pass
+        else:
+            raise AssertionError('unserializable routine parameter encoded')
+
+    # The payloads must not depend on whether orjson is installed.
+    routine_payloads: list = _get_routine_payloads(functions)
+    orjson_module: object = sys.modules.get('orjson')
+    sys.modules['orjson'] = None
+
+    try:
+        assert _get_routine_payloads(importlib.reload(functions)) == routine_payloads
+    finally:
+        if orjson_module is None:
+            del sys.modules['orjson']
+        else:
+            sys.modules['orjson'] = orjson_module
+
+        importlib.reload(functions)
+
+    print('info: <tencent.cloud.serverless.functions.payload> test completed')
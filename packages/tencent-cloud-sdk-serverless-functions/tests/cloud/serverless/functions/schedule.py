@@ -0,0 +1,70 @@
+# Copyright (c) 2022 MIEK
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import time
+
+def run_unit_tests():
+    from tencent.cloud.auth import credentials
+    from tencent.cloud.serverless import functions
+
+    invoked_function_names: list = list()
+
+    class ScheduleClient(functions.Client):
+        async def invoke_async(self,
+            region_id: str,
+            namespace_name: str,
+            function_name: str,
+            *invoke_arguments: tuple
+        ) -> dict:
+            invoked_function_names.append(function_name)
+            return { 'return_result': '1' }
+
+    function_client: ScheduleClient = ScheduleClient(
+        access_credentials = credentials.Credentials(
+            secret_id = 'AKIDiW4OSFF69wSiiSq9NN7UecLo49zbvCds',
+            secret_key = 'BE7mLi0AaVDfrAG8mNm4A6mHlzyg7ML3'
+        )
+    )
+
+    # Scheduled invokes with the same invoke time fire in submission order,
+    # releasing placeholders in address order makes the scheduled invoke
+    # tasks allocated next have descending addresses.
+    invoke_timestamp: int = int(time.time()) + 1
+    function_names: list = [ 'hello' + str(index) for index in range(16) ]
+
+    placeholders: list = sorted((functions.FunctionSchedule.__new__(
+        functions.FunctionSchedule) for _ in range(64)), key = id)
+
+    while placeholders:
+        placeholders.pop(0)
+
+    for function_name in function_names:
+        function_client.schedule_invoke(
+            region_id = 'ap-shanghai',
+            namespace_name = 'unittest',
+            function_name = function_name,
+            invoke_timestamp = invoke_timestamp
+        )
+
+    function_client.run_schedule()
+
+    assert invoked_function_names == function_names
+
+    print('info: <tencent.cloud.serverless.functions.schedule> test completed')